@@ -6,13 +6,37 @@ Serves docs exactly as GitHub Pages would.
 
 import os
 import sys
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+class DocsRequestHandler(SimpleHTTPRequestHandler):
+    """Static handler that copies files with zero-copy sendfile."""
+
+    def copyfile(self, source, outputfile):
+        # os.sendfile streams file->socket in the kernel instead of a
+        # Python read/write loop. Generated responses (directory
+        # listings) are BytesIO without a real fd - fall back for those.
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+        except (AttributeError, OSError):
+            return super().copyfile(source, outputfile)
+
+        try:
+            size = os.fstat(in_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            return super().copyfile(source, outputfile)
 
 def main():
     # Change to docs directory
     docs_dir = os.path.join(os.path.dirname(__file__), 'docs')
     os.chdir(docs_dir)
-    
+
     # Use port 8000 by default
     port = 8000
     if len(sys.argv) > 1:
@@ -21,19 +45,19 @@ def main():
         except ValueError:
             print(f"Invalid port: {sys.argv[1]}")
             sys.exit(1)
-    
-    # Start server
+
+    # Start server (threaded, so concurrent page loads don't serialize)
     server_address = ('', port)
-    httpd = HTTPServer(server_address, SimpleHTTPRequestHandler)
-    
+    httpd = ThreadingHTTPServer(server_address, DocsRequestHandler)
+
     print(f"\n📁 Serving docs from: {os.getcwd()}")
     print(f"🌐 Server running at: http://localhost:{port}/")
     print("\nPress Ctrl-C to stop\n")
-    
+
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n\nServer stopped.")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
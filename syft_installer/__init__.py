@@ -1,24 +1,26 @@
 from syft_installer.__version__ import __version__
-from syft_installer._syftbox import (
-    install,
-    run,
-    install_and_run_if_needed,
-    status,
-    stop,
-    run_if_stopped,
-    uninstall,
-    InstallerSession
-)
 
 
 __all__ = [
     "__version__",
     "install",
-    "run", 
+    "run",
     "install_and_run_if_needed",
     "status",
     "stop",
     "run_if_stopped",
     "uninstall",
     "InstallerSession",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Load the implementation on first attribute access (PEP 562).
+
+    'import syft_installer' stays nearly free; the API module and its
+    dependencies are only pulled in when something is actually used.
+    """
+    if name in __all__:
+        from syft_installer import _syftbox
+        return getattr(_syftbox, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,8 @@ class Authenticator:
     
     def __init__(self, server_url: str = "https://syftbox.net"):
         self.server_url = server_url.rstrip("/")
+        # One keep-alive session for the whole OTP flow: request_otp and
+        # verify_otp reuse the same TCP+TLS connection
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "syft-installer/0.3.1",
@@ -81,7 +83,7 @@ class Authenticator:
         data = {"email": email, "code": otp}  # API expects "code" not "otp"
         
         try:
-            response = self.session.post(url, json=data)
+            response = self.session.post(url, json=data, timeout=30)
             response.raise_for_status()
             result = response.json()
             
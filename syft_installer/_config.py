@@ -1,11 +1,34 @@
 import json
+import os
+import threading
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
+try:  # optional accelerator - stdlib json is the fallback
+    import orjson as _fast_json
+except ImportError:
+    _fast_json = None
+
 from syft_installer._utils import ConfigError, RuntimeEnvironment
 
 
+# path -> ((st_mtime_ns, st_size), Config) of successful loads - lets
+# repeated status/run calls skip re-reading and re-parsing an unchanged
+# config file. Nanosecond mtime plus size catches rewrites that land
+# within the same coarse mtime tick; keying on the path keeps entries
+# correct when the home directory changes (tests patch Path.home).
+_load_cache = {}
+_load_cache_lock = threading.Lock()
+
+
+def _invalidate_cache() -> None:
+    """Drop all cached configs (e.g. after uninstall deletes the file)."""
+    with _load_cache_lock:
+        _load_cache.clear()
+
+
 @dataclass
 class Config:
     """SyftBox configuration."""
@@ -14,28 +37,33 @@ class Config:
     server_url: str = "https://syftbox.net"
     client_url: str = "http://localhost:7938"
     refresh_token: Optional[str] = None
-    
+
+    # Field names frozen once at class creation - to_dict/load shouldn't
+    # re-introspect the dataclass on every call
+    _FIELDS = ("email", "data_dir", "server_url", "client_url", "refresh_token")
+
     def __post_init__(self):
         """Set default data_dir if not provided."""
         if not self.data_dir:
             self.data_dir = RuntimeEnvironment().default_data_dir
-    
+        # hash of the last payload this instance wrote (not a field)
+        self._last_saved_hash = None
+
     def to_dict(self) -> dict:
         """Convert config to dictionary (replacement for model_dump)."""
-        from dataclasses import asdict
-        return asdict(self)
+        return {name: getattr(self, name) for name in self._FIELDS}
     
-    @property
+    @cached_property
     def config_dir(self) -> Path:
         """Get configuration directory path."""
         return Path.home() / ".syftbox"
     
-    @property
+    @cached_property
     def config_file(self) -> Path:
         """Get configuration file path."""
         return self.config_dir / "config.json"
     
-    @property
+    @cached_property
     def binary_path(self) -> Path:
         """Get binary installation path."""
         return Path.home() / ".local" / "bin" / "syftbox"
@@ -47,31 +75,68 @@ class Config:
             self.config_dir.mkdir(parents=True, exist_ok=True)
             
             # Don't save access token (only refresh token)
-            # Use the exact field names expected by syftbox
-            data = {
-                "email": self.email,
-                "data_dir": self.data_dir,
-                "server_url": self.server_url,
-                "client_url": self.client_url,
-                "refresh_token": self.refresh_token
-            }
-            
-            with open(self.config_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Field names match what syftbox expects
+            data = self.to_dict()
+
+            payload = (
+                _fast_json.dumps(data, option=_fast_json.OPT_INDENT_2)
+                if _fast_json
+                else json.dumps(data, indent=2).encode()
+            )
+            # Token refreshes re-save the config; skip the write when the
+            # payload is byte-identical and the file is still in place
+            config_file = self.config_file
+            payload_hash = hash(payload)
+            if payload_hash == self._last_saved_hash and config_file.exists():
+                return
+
+            # Write-tmp-then-rename so readers never see a partial file,
+            # with the fd opened 0o600 - the file holds a refresh token
+            tmp_file = config_file.parent / (config_file.name + ".tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, config_file)
+            self._last_saved_hash = payload_hash
+
+            # Seed the load cache with what we just wrote so the next
+            # load() is a stat-only hit
+            try:
+                st = config_file.stat()
+                with _load_cache_lock:
+                    _load_cache[config_file] = ((st.st_mtime_ns, st.st_size), self)
+            except OSError:
+                pass
         except Exception as e:
             raise ConfigError(f"Failed to save configuration: {str(e)}")
     
     @classmethod
     def load(cls) -> Optional["Config"]:
-        """Load configuration from disk."""
+        """Load configuration from disk.
+
+        The parsed config is cached keyed on the file's mtime, so only
+        the first call (or a call after the file changed) pays for the
+        read and JSON parse.
+        """
         config_file = Path.home() / ".syftbox" / "config.json"
-        
-        if not config_file.exists():
+
+        try:
+            st = config_file.stat()
+        except OSError:
             return None
-        
+
+        key = (st.st_mtime_ns, st.st_size)
+        with _load_cache_lock:
+            cached = _load_cache.get(config_file)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         try:
-            with open(config_file, "r") as f:
-                data = json.load(f)
+            with open(config_file, "rb") as f:
+                raw = f.read()
+            data = _fast_json.loads(raw) if _fast_json else json.loads(raw)
             
             # Ensure data_dir is set
             if "data_dir" not in data or not data["data_dir"]:
@@ -79,11 +144,12 @@ class Config:
             
             # Filter out any fields that aren't in our dataclass
             # This handles cases where the config file has extra fields
-            import inspect
-            valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
-            filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+            filtered_data = {k: v for k, v in data.items() if k in cls._FIELDS}
             
-            return cls(**filtered_data)
+            config = cls(**filtered_data)
+            with _load_cache_lock:
+                _load_cache[config_file] = (key, config)
+            return config
         except Exception as e:
             # Return None instead of raising an exception
             # This could happen if the file is corrupted or has wrong format
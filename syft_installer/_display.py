@@ -5,26 +5,20 @@ This module provides a polished user experience with progress bars,
 temporary status updates, and inspiring messaging designed to create
 a great first impression of the Syft ecosystem.
 """
-import time
 from contextlib import contextmanager
+from functools import cached_property
 from typing import Optional, Iterator
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
-from rich.live import Live
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich import box
-
 
 class SyftDisplay:
     """Clean, inspiring display system for SyftBox installation."""
-    
-    def __init__(self):
-        self.console = Console()
-        self._current_progress: Optional[Progress] = None
-        self._current_live: Optional[Live] = None
+
+    @cached_property
+    def console(self):
+        """Console created on first render - importing rich and probing
+        the terminal at module import time costs every non-UI caller."""
+        from rich.console import Console
+        return Console()
     
     @contextmanager
     def installation_progress(self, email: str) -> Iterator[object]:
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Optional
 
 import requests
-from rich.progress import Progress, DownloadColumn, TransferSpeedColumn
 
 from syft_installer._utils import DownloadError, PlatformError, get_binary_url
 
@@ -1,38 +1,83 @@
 """Unified process management for SyftBox."""
+import logging
 import os
+import select
 import signal
 import subprocess
-import tempfile
+import sys
 import time
 from pathlib import Path
 from typing import List, Dict, Optional
 
 from syft_installer._utils import BinaryNotFoundError
 
+logger = logging.getLogger(__name__)
+
+def _enable_debug_logging() -> None:
+    """Surface this module's DEBUG records on stderr (at most one handler)."""
+    logger.setLevel(logging.DEBUG)
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+
+
+# Opt-in diagnostics: what used to be unconditional prints is DEBUG
+# logging now, surfaced by setting SYFT_INSTALLER_DEBUG=1
+if os.environ.get("SYFT_INSTALLER_DEBUG"):
+    _enable_debug_logging()
+
+_IS_WINDOWS = sys.platform == "win32"
+
+def _pid_file() -> Path:
+    """Path recording the last daemon we launched.
+
+    Resolved per call rather than at import so it honors HOME changes,
+    the same reason _config.py keys its cache per path.
+    """
+    return Path.home() / ".syftbox" / "daemon.pid"
+
 
 class ProcessManager:
     """Manages SyftBox daemon processes - both starting and finding/killing."""
-    
+
+    # How long a cached is_running() result stays valid (seconds)
+    _RUNNING_TTL = 0.5
+
     def __init__(self, verbose: bool = False):
         self.process: Optional[subprocess.Popen] = None
         self.stderr_file = None
+        # Diagnostics go through logging now; verbose=True turns on the
+        # same debug output callers got from the old prints
         self.verbose = verbose
+        if verbose:
+            _enable_debug_logging()
+        self._binary_checked = False
+        self._running_cache: Optional[tuple] = None
+        self._pgid: Optional[int] = None
     
     def start(self, config, background: bool = True, progress_callback=None) -> Optional[int]:
         """Start SyftBox client. Returns PID if successful."""
+        # If we already own a live process there is nothing to scan for
+        if self.process and self.process.poll() is None:
+            return self.process.pid
+
+        self._running_cache = None
         if self.is_running():
             return self.process.pid if self.process else None
         
-        # Check binary exists
-        if not config.binary_path.exists():
-            raise BinaryNotFoundError(f"SyftBox binary not found at {config.binary_path}")
+        # Check the binary once per manager; a single access() call
+        # covers both existence and the execute bit Popen needs
+        if not self._binary_checked:
+            if not os.access(str(config.binary_path), os.X_OK):
+                raise BinaryNotFoundError(
+                    f"SyftBox binary missing or not executable at {config.binary_path}"
+                )
+            self._binary_checked = True
         
         # Build command
         cmd = [str(config.binary_path), "daemon"]
         
-        if self.verbose:
-            print(f"📌 Binary path: {config.binary_path}")
-            print(f"📌 Command to execute: {cmd}")
+        logger.debug("Binary path: %s", config.binary_path)
+        logger.debug("Command to execute: %s", cmd)
         
         if background:
             self._run_background(cmd, progress_callback)
@@ -47,26 +92,98 @@ class ProcessManager:
         Returns:
             True if a process was stopped, False otherwise
         """
+        self._running_cache = None
+        stopped = False
         if self.process and self.process.poll() is None:
-            # Only print if we actually have a process to stop
-            if self.verbose:
-                print("   Stopping process...")
+            logger.debug("Stopping process...")
             try:
-                self.process.terminate()
-                # Give it time to shutdown gracefully
-                for _ in range(10):
-                    if self.process.poll() is not None:
-                        break
-                    time.sleep(0.5)
-                # Force kill if still running
-                if self.process.poll() is None:
-                    self.process.kill()
-                return True
-            except Exception:
+                # When we own the process group, one killpg signals the
+                # daemon and any children it spawned in a single syscall
+                if self._pgid is not None and not _IS_WINDOWS:
+                    os.killpg(self._pgid, signal.SIGTERM)
+                else:
+                    self.process.terminate()
+            except OSError:
+                # Already gone (e.g. ProcessLookupError) - nothing to stop
                 pass
-        return False
-        
-        # Clean up stderr file
+            else:
+                if not self._wait_for_exit(5.0):
+                    # Force kill if still running
+                    try:
+                        if self._pgid is not None and not _IS_WINDOWS:
+                            os.killpg(self._pgid, signal.SIGKILL)
+                        else:
+                            self.process.kill()
+                    except OSError:
+                        pass
+                stopped = True
+            self._pgid = None
+
+        if stopped:
+            self._clear_pid_file()
+        self._cleanup_stderr_file()
+        return stopped
+
+    def _wait_for_exit(self, timeout: float) -> bool:
+        """Wait for the managed process to exit.
+
+        On Linux 5.3+ this blocks on a pidfd, getting a single kernel
+        wakeup when the child exits instead of a poll loop. Falls back
+        to Popen.wait elsewhere.
+
+        Returns:
+            True if the process exited within the timeout
+        """
+        if hasattr(os, "pidfd_open"):
+            try:
+                pfd = os.pidfd_open(self.process.pid)
+            except (OSError, TypeError):
+                pass
+            else:
+                try:
+                    ready, _, _ = select.select([pfd], [], [], timeout)
+                finally:
+                    os.close(pfd)
+                if not ready:
+                    return False
+                self.process.wait()  # reap, returns immediately
+                return True
+
+        try:
+            self.process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
+    def _died_early(self, timeout: float) -> bool:
+        """Return True if the launched child exits within ``timeout``.
+
+        Uses waitid with WNOWAIT to peek at the child without reaping
+        it, so Popen's own poll()/wait() bookkeeping stays intact and
+        we can react the moment the daemon dies instead of always
+        sleeping the full grace period.
+        """
+        if hasattr(os, "waitid"):
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    info = os.waitid(
+                        os.P_PID, self.process.pid,
+                        os.WEXITED | os.WNOHANG | os.WNOWAIT,
+                    )
+                except (OSError, TypeError):
+                    break  # child already gone or unexpected pid type
+                if info is not None:
+                    return True
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.05)
+
+        time.sleep(timeout)
+        return self.process.poll() is not None
+
+    def _cleanup_stderr_file(self) -> None:
+        """Remove the temporary stderr log left behind by a background launch."""
         if self.stderr_file and hasattr(self.stderr_file, 'name'):
             try:
                 if os.path.exists(self.stderr_file.name):
@@ -74,81 +191,159 @@ class ProcessManager:
                     try:
                         with open(self.stderr_file.name, 'r') as f:
                             stderr_content = f.read().strip()
-                            if stderr_content and self.verbose:
-                                print(f"   Process stderr: {stderr_content}")
+                            if stderr_content:
+                                logger.debug("Process stderr: %s", stderr_content)
                     except:
                         pass
                     os.unlink(self.stderr_file.name)
             except:
                 pass
-    
+            self.stderr_file = None
+
     def is_running(self) -> bool:
-        """Check if SyftBox client is running."""
-        if self.verbose:
-            print("🔍 Checking if SyftBox is running...")
-        
+        """Check if SyftBox client is running.
+
+        The result is cached for a short TTL so back-to-back status
+        probes (e.g. run() followed by status()) share one process scan.
+        """
+        cached = self._running_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._RUNNING_TTL:
+            return cached[1]
+
+        result = self._probe_running()
+        self._running_cache = (now, result)
+        return result
+
+    def _find_syftbox_pids(self) -> List[int]:
+        """Find syftbox daemon PIDs by scanning /proc (Linux only).
+
+        Stays in-process: no pgrep/ps fork, just a directory walk and one
+        read per candidate PID.
+        """
+        pids = []
+        for entry in os.scandir('/proc'):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            # Match the adjacent phrase like pgrep -f "syftbox daemon"
+            # did - two separate words anywhere in argv (e.g. a shell
+            # whose command line mentions both) must not match, since
+            # kill_all_daemons() signals every PID returned here
+            if b"syftbox daemon" in cmdline.replace(b"\0", b" "):
+                pids.append(int(entry.name))
+        return pids
+
+    def _check_pid_file(self) -> bool:
+        """Check liveness of the daemon recorded in the PID file.
+
+        Returns True only when the recorded PID is alive and /proc
+        confirms it is still a syftbox process, so only on Linux; stale
+        files are removed and everything else falls back to a full scan.
+        """
+        pid_file = _pid_file()
+        try:
+            pid = int(pid_file.read_text())
+        except (OSError, ValueError):
+            return False
+
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            try:
+                pid_file.unlink()
+            except OSError:
+                pass
+            return False
+        except PermissionError:
+            pass  # process exists but belongs to another user
+
+        # Guard against PID reuse after a reboot or crash
+        if sys.platform == "linux":
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    if b"syftbox" not in f.read():
+                        return False
+            except OSError:
+                return False
+            return True
+
+        # No /proc elsewhere to confirm the pid is still syftbox; the
+        # file survives reboots, so a reused pid would look alive
+        # forever. Treat it as a hint only and fall through to the scan.
+        return False
+
+    def _write_pid_file(self, pid: int) -> None:
+        """Record the launched daemon's PID for fast liveness checks."""
+        pid_file = _pid_file()
+        try:
+            pid_file.parent.mkdir(parents=True, exist_ok=True)
+            pid_file.write_text(str(pid))
+        except OSError:
+            pass
+
+    def _clear_pid_file(self) -> None:
+        """Forget the recorded PID once the daemon has been stopped."""
         try:
-            # Check for syftbox daemon process
+            _pid_file().unlink()
+        except OSError:
+            pass
+
+    def _probe_running(self) -> bool:
+        """Scan the process table for a syftbox daemon."""
+        logger.debug("Checking if SyftBox is running...")
+
+        # Fast path: one kill(pid, 0) on the recorded daemon PID
+        if self._check_pid_file():
+            return True
+
+        if sys.platform == "linux":
+            try:
+                return bool(self._find_syftbox_pids())
+            except OSError:
+                pass  # /proc unavailable - fall through to pgrep
+
+        try:
+            # Check for syftbox daemon process. Only the exit status
+            # matters, so don't allocate pipes or decode output.
             result = subprocess.run(
                 ["pgrep", "-f", "syftbox daemon"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-            
-            if self.verbose:
-                print(f"   pgrep return code: {result.returncode}")
-                print(f"   pgrep stdout: {repr(result.stdout)}")
-                print(f"   pgrep stderr: {repr(result.stderr)}")
-            
-            if result.returncode == 0:
-                pids = result.stdout.strip().split('\n')
-                pids = [p for p in pids if p]
-                if self.verbose:
-                    print(f"   Found PIDs: {pids}")
-                return len(pids) > 0
-            
-            if self.verbose:
-                print("   No processes found via pgrep")
-            return False
-            
+
+            logger.debug("pgrep return code: %s", result.returncode)
+            return result.returncode == 0
+
+
         except Exception as e:
-            if self.verbose:
-                print(f"   pgrep failed with exception: {e}")
-            
-            # Fallback for systems without pgrep
+            logger.debug("pgrep failed (%s), trying ps aux fallback", e)
+
+            # Fallback for systems without pgrep. Keep stdout as bytes:
+            # only a substring check is needed, so skip decoding the
+            # whole process table.
             try:
-                if self.verbose:
-                    print("   Trying ps aux fallback...")
-                
                 result = subprocess.run(
                     ["ps", "aux"],
                     capture_output=True,
-                    text=True,
                 )
-                
-                if self.verbose:
-                    print(f"   ps aux return code: {result.returncode}")
-                
-                found = "syftbox daemon" in result.stdout
-                if found and self.verbose:
-                    for line in result.stdout.split('\n'):
-                        if 'syftbox' in line and 'grep' not in line:
-                            print(f"   Found process: {line.strip()}")
-                
-                if self.verbose:
-                    print(f"   Result: {'Found' if found else 'Not found'} via ps aux")
-                
+
+                found = b"syftbox daemon" in result.stdout
+                logger.debug("ps aux result: %s", "found" if found else "not found")
+
                 return found
-                
+
             except Exception as e2:
-                if self.verbose:
-                    print(f"   ps aux also failed: {e2}")
+                logger.debug("ps aux also failed: %s", e2)
                 return False
     
     def find_daemons(self) -> List[Dict[str, str]]:
         """Find all running syftbox processes."""
-        if self.verbose:
-            print("🔍 Looking for syftbox processes...")
+        logger.debug("Looking for syftbox processes...")
         
         try:
             result = subprocess.run(
@@ -160,15 +355,9 @@ class ProcessManager:
             
             processes = []
             lines = result.stdout.strip().split('\n')
-            
-            if self.verbose:
-                print(f"   Found {len(lines)-1} total processes")
-            
+
             for line in lines[1:]:  # Skip header
                 if 'syftbox' in line and 'grep' not in line:
-                    if self.verbose:
-                        print(f"   Syftbox process found: {line[:80]}...")
-                    
                     parts = line.split(None, 10)  # Split into max 11 parts
                     if len(parts) >= 11:
                         processes.append({
@@ -181,14 +370,12 @@ class ProcessManager:
                             'command': parts[10]
                         })
             
-            if self.verbose:
-                print(f"   Found {len(processes)} syftbox processes")
-            
+            logger.debug("Found %d syftbox processes", len(processes))
+
             return processes
-            
+
         except Exception as e:
-            if self.verbose:
-                print(f"   Error finding daemons: {e}")
+            logger.debug("Error finding daemons: %s", e)
             return []
     
     def kill_daemon(self, pid: str, force: bool = False) -> bool:
@@ -205,13 +392,34 @@ class ProcessManager:
     
     def kill_all_daemons(self, force: bool = False) -> int:
         """Kill all syftbox daemons."""
+        self._running_cache = None
+        if sys.platform == "linux":
+            # Signal straight from the /proc scan - each os.kill is a
+            # single syscall, so no ps fork or event loop is needed
+            try:
+                pids = self._find_syftbox_pids()
+            except OSError:
+                pids = None
+            if pids is not None:
+                killed = 0
+                sig = signal.SIGKILL if force else signal.SIGTERM
+                for pid in pids:
+                    try:
+                        os.kill(pid, sig)
+                        killed += 1
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                self._clear_pid_file()
+                return killed
+
         daemons = self.find_daemons()
         killed = 0
-        
+
         for daemon in daemons:
             if self.kill_daemon(daemon['pid'], force):
                 killed += 1
-        
+
+        self._clear_pid_file()
         return killed
     
     def _run_foreground(self, cmd: list) -> None:
@@ -224,20 +432,15 @@ class ProcessManager:
     
     def _run_background(self, cmd: list, progress_callback=None) -> None:
         """Run client in background."""
-        if self.verbose:
-            print(f"🚀 Launching daemon with command: {' '.join(cmd)}")
+        logger.debug("Launching daemon with command: %s", cmd)
         
         try:
-            import platform
-            system = platform.system()
-            
-            if self.verbose:
-                print(f"   Platform: {system}")
-            
+            system = "Windows" if _IS_WINDOWS else sys.platform
+
             if progress_callback:
                 progress_callback(70, f"🔧 Detected {system} environment")
-            
-            if system == "Windows":
+
+            if _IS_WINDOWS:
                 # Windows doesn't have nohup, use START instead
                 self.process = subprocess.Popen(
                     cmd,
@@ -247,33 +450,26 @@ class ProcessManager:
                 )
             else:
                 # Unix-like systems
+                import tempfile
                 self.stderr_file = tempfile.NamedTemporaryFile(mode='w+', delete=False, prefix='syftbox_stderr_')
-                
-                if self.verbose:
-                    print(f"   Stderr will be logged to: {self.stderr_file.name}")
-                
+                logger.debug("Stderr will be logged to: %s", self.stderr_file.name)
+
                 # Check if we're in a restricted environment (Colab, Jupyter, etc.)
+                # where detaching into a new session can fail
                 restricted_env = False
                 try:
                     import google.colab
                     restricted_env = True
                 except ImportError:
-                    # Test if preexec_fn works - it fails in some notebook environments
                     try:
-                        # Quick test to see if preexec_fn works
-                        test_proc = subprocess.Popen(
-                            ['echo', 'test'], 
-                            stdout=subprocess.DEVNULL, 
-                            stderr=subprocess.DEVNULL,
-                            preexec_fn=lambda: None
-                        )
-                        test_proc.wait()
-                    except (OSError, AttributeError, TypeError):
+                        get_ipython()  # This is defined in IPython/Jupyter
                         restricted_env = True
-                
-                if self.verbose and restricted_env:
-                    print("   ⚠️  Detected restricted environment - using simple subprocess")
-                
+                    except NameError:
+                        pass
+
+                if restricted_env:
+                    logger.debug("Detected restricted environment - using simple subprocess")
+
                 if restricted_env:
                     # In restricted environments, use minimal subprocess options
                     self.process = subprocess.Popen(
@@ -283,51 +479,23 @@ class ProcessManager:
                         stdin=subprocess.DEVNULL
                     )
                 else:
-                    # Regular Unix environment
-                    # Check if we're in a Jupyter/IPython environment
-                    in_jupyter = False
-                    try:
-                        get_ipython()  # This is defined in IPython/Jupyter
-                        in_jupyter = True
-                    except NameError:
-                        pass
-                    
-                    if in_jupyter:
-                        # Jupyter environment - use simpler subprocess call
-                        self.process = subprocess.Popen(
-                            cmd,
-                            stdout=subprocess.DEVNULL,
-                            stderr=self.stderr_file,
-                            stdin=subprocess.DEVNULL
-                        )
-                    else:
-                        # Regular terminal - try full daemon mode, fallback if needed
-                        try:
-                            self.process = subprocess.Popen(
-                                cmd,
-                                stdout=subprocess.DEVNULL,
-                                stderr=self.stderr_file,
-                                stdin=subprocess.DEVNULL,
-                                start_new_session=True,
-                                preexec_fn=os.setsid
-                            )
-                        except (OSError, subprocess.SubprocessError) as e:
-                            if self.verbose:
-                                print(f"   ⚠️  Full daemon mode failed ({e}), using simple mode")
-                            # Fallback to simpler subprocess without preexec_fn
-                            self.process = subprocess.Popen(
-                                cmd,
-                                stdout=subprocess.DEVNULL,
-                                stderr=self.stderr_file,
-                                stdin=subprocess.DEVNULL,
-                                start_new_session=True
-                            )
-                
-                # Give it a moment to start
-                time.sleep(1)
-                
+                    # Regular terminal. start_new_session already runs
+                    # setsid in the child, and avoiding preexec_fn keeps
+                    # CPython on its fast posix_spawn path (no full fork
+                    # of the parent address space).
+                    self.process = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.DEVNULL,
+                        stderr=self.stderr_file,
+                        stdin=subprocess.DEVNULL,
+                        start_new_session=True
+                    )
+                    # start_new_session makes the child its own group
+                    # leader, so its pgid equals its pid - no getpgid call
+                    self._pgid = self.process.pid
+
                 # Check if process started successfully
-                if self.process.poll() is not None:
+                if self._died_early(1.0):
                     # Process died immediately
                     print("   ❌ Process failed to start!")
                     if self.stderr_file and os.path.exists(self.stderr_file.name):
@@ -339,8 +507,9 @@ class ProcessManager:
                 else:
                     if progress_callback:
                         progress_callback(90, f"✅ Process started with PID: {self.process.pid}")
-                    elif self.verbose:
-                        print(f"   ✅ Process started with PID: {self.process.pid}")
+                    else:
+                        logger.debug("Process started with PID: %s", self.process.pid)
+                    self._write_pid_file(self.process.pid)
                 
         except Exception as e:
             print(f"   ❌ Failed to launch: {e}")
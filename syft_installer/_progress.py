@@ -89,20 +89,23 @@ def finish_progress(final_message: str):
     progress.finish(final_message)
 
 
-def progress_context():
+class ProgressContext:
+    """Thin wrapper that starts the global progress bar on first update."""
+
+    def __init__(self):
+        self.started = False
+
+    def update(self, step: int, message: str, total: int = 100):
+        if not self.started:
+            progress.start(total)
+            self.started = True
+        progress.update(step, message)
+
+    def finish(self, final_message: str):
+        if self.started:
+            progress.finish(final_message)
+
+
+def progress_context() -> ProgressContext:
     """Context manager for progress display."""
-    class ProgressContext:
-        def __init__(self):
-            self.started = False
-        
-        def update(self, step: int, message: str, total: int = 100):
-            if not self.started:
-                progress.start(total)
-                self.started = True
-            progress.update(step, message)
-        
-        def finish(self, final_message: str):
-            if self.started:
-                progress.finish(final_message)
-    
     return ProgressContext()
\ No newline at end of file
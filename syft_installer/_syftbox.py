@@ -17,25 +17,45 @@ Usage:
     si.uninstall()
 """
 import os
-import shutil
 import sys
+import threading
 import time
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
 from contextlib import contextmanager, redirect_stdout, redirect_stderr
 from io import StringIO
-from rich.console import Console
 
+from syft_installer.__version__ import __version__
 from syft_installer._config import Config as _Config
 from syft_installer._process import ProcessManager as _ProcessManager
 from syft_installer._display import display
 from syft_installer._progress import progress_context
 
 
-_console = Console()
+# Resolved once at import - Path.home() re-reads the environment on
+# every call, and these locations never change within a process
+_HOME = Path.home()
+_DEFAULT_DATA_DIR = _HOME / "SyftBox"
+_CONFIG_DIR = _HOME / ".syftbox"
+_BIN_DIR = _HOME / ".local" / "bin"
+_BINARY_PATH = _BIN_DIR / "syftbox"
+
+# Created on first print - instantiating a rich Console probes the
+# terminal, which scripted callers that never print shouldn't pay for
+_console = None
 _silent_mode = False
 
 
+def _get_console():
+    """Get (creating if needed) the shared rich console."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
 @contextmanager
 def silence_output():
     """Context manager to silence all output."""
@@ -59,6 +79,47 @@ def silence_output():
         _silent_mode = old_silent
 
 
+def _fast_rmtree(path: Path) -> None:
+    """Delete a directory tree using scandir's cached entry types.
+
+    shutil.rmtree re-stats every entry to classify it; DirEntry already
+    knows from the directory read itself, so this walk issues just one
+    unlink/rmdir per entry. An explicit stack avoids Python recursion
+    overhead on deep synced trees. Errors are ignored, matching the
+    best-effort semantics of uninstall().
+    """
+    stack = [str(path)]
+    # Directories we already failed to scan or remove; never re-push
+    # these when their parent is re-scanned, or the walk would retry
+    # an undeletable subtree forever
+    failed = set()
+    while stack:
+        current = stack[-1]
+        has_subdirs = False
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path not in failed:
+                            stack.append(entry.path)
+                            has_subdirs = True
+                    else:
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            failed.add(current)
+            stack.pop()
+            continue
+        if not has_subdirs:
+            stack.pop()
+            try:
+                os.rmdir(current)
+            except OSError:
+                failed.add(current)
+
+
 def _print(*args, **kwargs):
     """Print wrapper that respects silent mode."""
     if not _silent_mode:
@@ -68,7 +129,7 @@ def _print(*args, **kwargs):
 def _console_print(*args, **kwargs):
     """Console print wrapper that respects silent mode."""
     if not _silent_mode:
-        _console.print(*args, **kwargs)
+        _get_console().print(*args, **kwargs)
 
 
 class InstallerSession:
@@ -124,14 +185,7 @@ class InstallerSession:
             _console_print("✅ Authentication successful")
             
             # Create and save config
-            config = _Config(
-                email=self.email,
-                data_dir=str(self.syftbox.data_dir),
-                server_url=self.syftbox.server,
-                client_url="http://localhost:7938",
-                refresh_token=tokens["refresh_token"]
-            )
-            config.save()
+            config = self.syftbox._persist_config(self.email, tokens["refresh_token"])
             _console_print("✅ Configuration saved")
             
             self._installation_complete = True
@@ -142,7 +196,8 @@ class InstallerSession:
                 _console_print("\n▶️  Starting SyftBox client...")
                 self.syftbox._process_manager.start(config, background=True)
                 _console_print("✅ SyftBox client started!\n")
-                self.syftbox.status()
+                # We just installed and started - no need to re-probe
+                self.syftbox._show_status(True, True, config)
             
             return {"status": "success", "message": "Installation complete"}
                     
@@ -157,7 +212,11 @@ class InstallerSession:
 
 class _SyftBox:
     """Dead simple SyftBox manager."""
-    
+
+    # How long a cached is_installed result stays valid (seconds)
+    _INSTALLED_TTL = 1.0
+
+
     def __init__(self, 
                  email: Optional[str] = None,
                  server: str = "https://syftbox.net",
@@ -172,14 +231,60 @@ class _SyftBox:
         """
         self.email = email
         self.server = server
-        self.data_dir = Path(data_dir).expanduser() if data_dir else Path.home() / "SyftBox"
-        self._process_manager = _ProcessManager(verbose=False)
+        self.data_dir = Path(data_dir).expanduser() if data_dir else _DEFAULT_DATA_DIR
+        self._saved_config: Optional[_Config] = None
+        self._installed_cache: Optional[tuple] = None
+
+    @cached_property
+    def _process_manager(self) -> _ProcessManager:
+        """Process manager, created on first use."""
+        return _ProcessManager(verbose=False)
+
+    def _persist_config(self, email: str, refresh_token: str) -> _Config:
+        """Build and save the client config for a completed login.
+
+        Skips the disk write when the same refresh token was already
+        persisted by this instance (e.g. verify followed by install in
+        the same notebook session).
+        """
+        cached = self._saved_config
+        if cached is not None and cached.refresh_token == refresh_token and cached.email == email:
+            return cached
+
+        config = _Config(
+            email=email,
+            data_dir=str(self.data_dir),
+            server_url=self.server,
+            client_url="http://localhost:7938",
+            refresh_token=refresh_token
+        )
+        config.save()
+        self._saved_config = config
+        return config
     
     @property
     def is_installed(self) -> bool:
-        """Check if SyftBox is installed."""
-        config = _Config.load()
-        return config is not None
+        """Check if SyftBox is installed (binary present and config valid).
+
+        Cached for a short TTL so polling loops don't hammer the
+        filesystem; install and uninstall invalidate it immediately.
+        """
+        cached = self._installed_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._INSTALLED_TTL:
+            return cached[1]
+
+        try:
+            # One cheap syscall guards the JSON parse - on a first-time
+            # run() the binary is missing and we never open the config
+            os.stat(_BINARY_PATH)
+        except OSError:
+            result = False
+        else:
+            result = _Config.load() is not None
+
+        self._installed_cache = (now, result)
+        return result
     
     @property
     def is_running(self) -> bool:
@@ -201,33 +306,43 @@ class _SyftBox:
         Returns:
             Status dictionary
         """
-        is_installed = self.is_installed
-        is_running = self.is_running
-        
+        # Evaluate each probe exactly once - is_installed re-reads the
+        # config and is_running scans the process table
+        installed = self.is_installed
+        running = self.is_running
+
+        # Try to load config regardless of installation status
+        # (in case there's a race condition or partial installation)
+        return self._show_status(installed, running, self.config, detailed)
+
+    def _show_status(self, installed: bool, running: bool,
+                     config: Optional[_Config], detailed: bool = False) -> Dict[str, Any]:
+        """Build and display a status dict from already-known probe results.
+
+        Callers that just installed or started the client pass in what
+        they already know instead of re-running the probes.
+        """
         status = {
-            "installed": is_installed,
-            "running": is_running,
+            "installed": installed,
+            "running": running,
             "config": None,
             "daemons": []
         }
-        
-        # Try to load config regardless of installation status
-        # (in case there's a race condition or partial installation)
-        config = self.config
+
         if config:
             status["config"] = {
                 "email": config.email,
                 "server": config.server_url,
                 "data_dir": config.data_dir
             }
-        
-        if detailed or self.is_running:
+
+        if detailed or running:
             status["daemons"] = self._process_manager.find_daemons()
-        
+
         # Show clean status display
         display.show_status(
-            installed=is_installed,
-            running=is_running,
+            installed=installed,
+            running=running,
             email=config.email if config else None,
             data_dir=config.data_dir if config else None
         )
@@ -246,8 +361,6 @@ class _SyftBox:
         Args:
             background: Run client in background (default: True)
         """
-        from syft_installer.__version__ import __version__
-        
         # Show welcome message
         display.show_welcome(version=__version__)
         
@@ -261,22 +374,29 @@ class _SyftBox:
             return
         
         was_installed = self.is_installed
-        
+
         if not was_installed:
-            self._install()
-        
-        # Check configuration
-        try:
-            config = self.config
+            # _install hands back the config it just persisted, saving a
+            # reload right after writing the file
+            config = self._install()
+            if not config:
+                display.show_error(
+                    "Installation may have failed - no configuration found",
+                    "Try running si.install() again or check your internet connection"
+                )
+                return
+        else:
+            try:
+                config = self.config
+            except Exception as e:
+                display.show_error(f"Error loading configuration: {e}")
+                return
             if not config:
                 display.show_error(
                     "Installation may have failed - no configuration found",
                     "Try running si.install() again or check your internet connection"
                 )
                 return
-        except Exception as e:
-            display.show_error(f"Error loading configuration: {e}")
-            return
         
         # Start the daemon
         if was_installed:
@@ -346,15 +466,13 @@ class _SyftBox:
         else:
             # First try to stop the process we started
             stopped_our_process = self._process_manager.stop()
-            
-            # If there are still daemons running, we need to stop them
-            if self._process_manager.is_running():
-                # We didn't start this daemon, but we'll stop it anyway
-                killed = self._process_manager.kill_all_daemons()
-                if killed > 0:
-                    _console_print(f"\n⏹️  Stopped {killed} SyftBox daemon(s)\n")
-                else:
-                    _console_print("\n⚠️  Unable to stop SyftBox daemon\n")
+
+            # One enumerate-and-kill pass covers daemons we didn't start;
+            # its count doubles as the "anything still running?" probe,
+            # so no separate is_running() scan is needed
+            killed = self._process_manager.kill_all_daemons()
+            if killed > 0:
+                _console_print(f"\n⏹️  Stopped {killed} SyftBox daemon(s)\n")
             elif stopped_our_process:
                 # We successfully stopped our own process
                 _console_print("\n⏹️  Stopped SyftBox client\n")
@@ -403,27 +521,46 @@ class _SyftBox:
         # Stop all daemons quietly
         self._process_manager.kill_all_daemons()
         
-        # Delete directories and files
-        paths_to_delete = [
-            Path.home() / "SyftBox",
-            Path.home() / ".syftbox",
-            Path.home() / ".local" / "bin" / "syftbox"
+        # Delete directories and files. Each target is predeclared as
+        # (path, is_dir) so no exists()/is_dir() stat is needed - the
+        # delete call itself tells us when the path is already gone.
+        targets = [
+            (_DEFAULT_DATA_DIR, True),
+            (_CONFIG_DIR, True),
+            (_BINARY_PATH, False),
         ]
-        
-        for path in paths_to_delete:
-            if path.exists():
-                try:
-                    if path.is_dir():
-                        shutil.rmtree(path)
-                    else:
-                        path.unlink()
-                except Exception:
-                    pass  # Silently continue if deletion fails
-        
+
+        # The ~/SyftBox walk dominates; run the independent deletions in
+        # parallel so the binary and config removal overlap with it
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _delete_one(target):
+            path, is_dir = target
+            try:
+                if is_dir:
+                    _fast_rmtree(path)
+                else:
+                    path.unlink(missing_ok=True)
+            except Exception:
+                pass  # Silently continue if deletion fails
+
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            list(pool.map(_delete_one, targets))
+
+        # The config file is gone - drop the cached parse of it
+        from syft_installer._config import _invalidate_cache
+        _invalidate_cache()
+        self._saved_config = None
+        self._installed_cache = None
+
         display.show_uninstall_progress()
     
-    def _install(self) -> None:
-        """Run installation flow with single-line progress display."""
+    def _install(self) -> Optional[_Config]:
+        """Run installation flow with single-line progress display.
+
+        Returns:
+            The persisted config on success, None on failure
+        """
         # Auto-detect email in Colab if not provided
         email = self.email
         if email is None:
@@ -496,9 +633,9 @@ class _SyftBox:
                 update_progress_bar(i, message="📦 Setting up installation environment...")
                 time.sleep(0.02)
             
-            bin_dir = Path.home() / ".local" / "bin"
-            binary_path = bin_dir / "syftbox"
-            config_dir = Path.home() / ".syftbox"
+            bin_dir = _BIN_DIR
+            binary_path = _BINARY_PATH
+            config_dir = _CONFIG_DIR
             
             bin_dir.mkdir(parents=True, exist_ok=True)
             config_dir.mkdir(parents=True, exist_ok=True)
@@ -549,24 +686,19 @@ class _SyftBox:
                 update_progress_bar(i, message="💾 Saving configuration...")
                 time.sleep(0.02)
             
-            config = _Config(
-                email=email,
-                data_dir=str(self.data_dir),
-                server_url=self.server,
-                client_url="http://localhost:7938",
-                refresh_token=tokens["refresh_token"]
-            )
-            config.save()
-            
+            config = self._persist_config(email, tokens["refresh_token"])
+            self._installed_cache = None
+
             # Stay at 95% - daemon starting happens in run() method
             update_progress_bar(95, message="✅ Installation complete...")
-            
+
             # Installation is done but daemon not started yet - stay at 95%
-            
+            return config
+
         except Exception as e:
             sys.stdout.write(f"\r❌ Installation failed: {str(e)}\n")
             sys.stdout.flush()
-            return
+            return None
     
     def _run_non_interactive(self, background: bool = True) -> Optional[InstallerSession]:
         """
@@ -578,7 +710,6 @@ class _SyftBox:
         Returns:
             InstallerSession object if installation needed, None if already installed
         """
-        from syft_installer.__version__ import __version__
         _console_print(f"\n[bold]🚀 Starting SyftBox... (syft-installer v{__version__})[/bold]\n")
         
         if not self.is_installed:
@@ -605,9 +736,9 @@ class _SyftBox:
                 return None
             
             # Create directories and download binary
-            bin_dir = Path.home() / ".local" / "bin"
-            binary_path = bin_dir / "syftbox"
-            config_dir = Path.home() / ".syftbox"
+            bin_dir = _BIN_DIR
+            binary_path = _BINARY_PATH
+            config_dir = _CONFIG_DIR
             
             bin_dir.mkdir(parents=True, exist_ok=True)
             config_dir.mkdir(parents=True, exist_ok=True)
@@ -654,21 +785,38 @@ class _SyftBox:
                 _console_print("✅ SyftBox client started!\n")
             else:
                 _console_print("✅ SyftBox client already running!\n")
-                
-            self.status()
+
+            # Installed and running are both known at this point
+            self._show_status(True, True, config)
             return None
     
 
 
 # Module-level instance for super simple API
 _instance = None
+_instance_lock = threading.Lock()
 
 
 def _get_instance(**kwargs) -> _SyftBox:
-    """Get or create the global SyftBox instance."""
+    """Get or create the global SyftBox instance.
+
+    Later kwargs update the existing instance in place - rebuilding it
+    would discard the process manager and its caches, which the common
+    install() followed by run() sequence relies on.
+    """
     global _instance
-    if _instance is None or kwargs:
-        _instance = _SyftBox(**kwargs)
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = _SyftBox(**kwargs)
+                return _instance
+
+    for key, value in kwargs.items():
+        if value is None:
+            continue
+        if key == "data_dir":
+            value = Path(value).expanduser()
+        setattr(_instance, key, value)
     return _instance
 
 
@@ -762,9 +910,9 @@ def install(email: Optional[str] = None, interactive: bool = True, silent: bool
             return None
         
         # Create directories and download binary
-        bin_dir = Path.home() / ".local" / "bin"
-        binary_path = bin_dir / "syftbox"
-        config_dir = Path.home() / ".syftbox"
+        bin_dir = _BIN_DIR
+        binary_path = _BINARY_PATH
+        config_dir = _CONFIG_DIR
         
         bin_dir.mkdir(parents=True, exist_ok=True)
         config_dir.mkdir(parents=True, exist_ok=True)
@@ -7,8 +7,10 @@ that were previously split across multiple small modules.
 import os
 import platform
 import re
-from email.utils import parseaddr
+import string
+from functools import lru_cache
 from typing import Optional, Tuple
+from urllib.parse import urlsplit
 
 
 # ============================================================================
@@ -54,23 +56,50 @@ class BinaryNotFoundError(SyftInstallerError):
 # Validators
 # ============================================================================
 
+# Compiled once at import - re.match with a string pattern re-checks the
+# regex cache on every call. Email halves are validated separately so
+# each pattern is a single anchored character class with no backtracking.
+_EMAIL_LOCAL_PATTERN = re.compile(r"^[^\s@]{1,64}\Z")
+_EMAIL_DOMAIN_PATTERN = re.compile(r"^[^\s@]+\.[^\s@]+\Z")
+# Uppercases and deletes whitespace/dashes in a single C-level pass
+_OTP_CLEAN = str.maketrans(
+    string.ascii_lowercase,
+    string.ascii_uppercase,
+    " -\t\r\n\v\f"
+)
+
+# Deletes every character an OTP may contain; a valid OTP translates to
+# the empty string, so validation is one C scan instead of a regex
+_OTP_ALLOWED = str.maketrans("", "", string.ascii_uppercase + string.digits)
+
+
+@lru_cache(maxsize=1024)
+def _validate_email_cached(email: str) -> bool:
+    # Cheap C-level rejects before any regex work
+    if not email or len(email) > 254:
+        return False
+
+    local, sep, domain = email.partition("@")
+    if not sep or "@" in domain:
+        return False
+
+    return bool(_EMAIL_LOCAL_PATTERN.match(local)) and bool(_EMAIL_DOMAIN_PATTERN.match(domain))
+
+
 def validate_email(email: str) -> bool:
-    r"""
+    """
     Validate email address.
-    - Must pass RFC 5322 validation
-    - Must match pattern: ^[^\s@]+@[^\s@]+\.[^\s@]+$
+    - Must be exactly local@domain with no whitespace in either half
+    - Local part is at most 64 characters, domain must contain a dot
+
+    Splitting first and matching each half against a single anchored
+    character class keeps validation linear even on adversarial input.
+    Repeated inputs hit an LRU cache; the type gate stays outside it so
+    unhashable input can't blow up in the cache machinery.
     """
-    if not email:
-        return False
-    
-    # RFC 5322 validation
-    parsed = parseaddr(email)
-    if not parsed[1] or parsed[1] != email:
+    if type(email) is not str:
         return False
-    
-    # Additional pattern validation
-    pattern = r"^[^\s@]+@[^\s@]+\.[^\s@]+$"
-    return bool(re.match(pattern, email))
+    return _validate_email_cached(email)
 
 
 def validate_otp(otp: str) -> bool:
@@ -78,27 +107,66 @@ def validate_otp(otp: str) -> bool:
     Validate OTP code.
     - Must be exactly 8 characters
     - Must be uppercase alphanumeric only
+
+    Deliberately uncached: one-time passwords don't repeat, and an LRU
+    cache would pin them in process memory.
     """
-    if not otp:
+    if type(otp) is not str or not otp:
         return False
-    
-    pattern = r"^[0-9A-Z]{8}$"
-    return bool(re.match(pattern, otp))
+
+    return len(otp) == 8 and not otp.translate(_OTP_ALLOWED)
 
 
 def sanitize_otp(otp: str) -> str:
-    """Convert OTP to uppercase and remove spaces."""
-    return otp.strip().upper().replace(" ", "")
+    """Convert OTP to uppercase and strip whitespace/dashes."""
+    if type(otp) is not str:
+        return ""
+    return otp.translate(_OTP_CLEAN)
+
+
+@lru_cache(maxsize=1024)
+def _validate_url_cached(url: str) -> bool:
+    # Reject all whitespace up front - urlsplit silently strips embedded
+    # tabs and newlines, so it can't be trusted to surface them
+    if not url or any(c.isspace() for c in url):
+        return False
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+
+    return parts.scheme == "https" and bool(parts.netloc)
+
+
+def validate_url(url: str) -> bool:
+    """
+    Validate a server URL.
+    - Must be https with a non-empty host
+    - No whitespace anywhere
+
+    urlsplit does the structural work in C; a regex would be slower
+    and handle edge cases like an empty host less accurately. Repeated
+    inputs hit an LRU cache; the type gate stays outside it so
+    unhashable input can't blow up in the cache machinery.
+    """
+    if type(url) is not str:
+        return False
+    return _validate_url_cached(url)
 
 
 # ============================================================================
 # Platform Detection
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def get_platform_info() -> Tuple[str, str]:
     """
     Detect OS and architecture.
-    
+
+    The result is cached - the platform cannot change within a process,
+    and platform.system()/machine() probe the OS on every call.
+
     Returns:
         Tuple of (os_name, arch) where:
         - os_name: 'darwin' or 'linux'
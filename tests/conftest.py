@@ -0,0 +1,55 @@
+"""Shared pytest fixtures."""
+import dataclasses
+import subprocess
+from unittest.mock import Mock
+
+import pytest
+
+from syft_installer._config import Config
+
+
+# Golden prototype built once at collection; each test gets a fresh
+# copy so mutations can't leak between tests
+_GOLDEN_CONFIG = Config(
+    email="test@example.com",
+    server_url="https://syftbox.net",
+    data_dir="/path/to/data",
+    refresh_token="test_token"
+)
+
+
+@pytest.fixture
+def base_config():
+    """A representative Config, so tests don't rebuild the same one."""
+    return dataclasses.replace(_GOLDEN_CONFIG)
+
+
+# Beyond the largest possible Linux pid (2**22), so pidfd_open/kill on
+# the mock's pid can never address a real host process
+_FAKE_PID = 2**22 + 1
+
+
+@pytest.fixture
+def running_process():
+    """A mock process that is still alive."""
+    process = Mock()
+    process.poll.return_value = None
+    process.pid = _FAKE_PID
+    return process
+
+
+@pytest.fixture
+def exited_process():
+    """A mock process that has already exited."""
+    process = Mock()
+    process.poll.return_value = 0
+    process.pid = _FAKE_PID
+    return process
+
+
+@pytest.fixture
+def timeout_process(running_process):
+    """A mock process that ignores SIGTERM until killed."""
+    # Only the first wait times out; a wait after kill() would succeed
+    running_process.wait.side_effect = [subprocess.TimeoutExpired("cmd", 5), 0]
+    return running_process
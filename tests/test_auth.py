@@ -5,10 +5,13 @@ This script tests the OTP authentication flow step by step.
 """
 
 import sys
-import time
+
+import pytest
+
 from syft_installer._auth import Authenticator
 from syft_installer._utils import validate_email, validate_otp
 
+@pytest.mark.network
 def test_auth_flow():
     """Test the authentication flow interactively."""
     print("=== SyftBox Authentication Test ===\n")
@@ -72,30 +75,40 @@ def test_auth_flow():
         print(f"❌ OTP verification failed: {e}")
         return False
 
+@pytest.mark.network
 def test_endpoints():
     """Test that endpoints are reachable."""
+    from concurrent.futures import ThreadPoolExecutor
     import requests
-    
+
     print("=== Testing Endpoint Connectivity ===\n")
-    
+
     endpoints = [
         "https://syftbox.net",
         "https://syftbox.net/auth/otp/request",
         "https://syftbox.net/auth/otp/verify",
         "https://syftbox.net/auth/refresh",
     ]
-    
-    for endpoint in endpoints:
+
+    # One keep-alive session so all probes share a TLS handshake, run in
+    # parallel so wall time is ~1 RTT instead of 4
+    session = requests.Session()
+
+    def probe(endpoint):
         try:
             # Just test connectivity, don't worry about response
-            response = requests.head(endpoint, timeout=5, allow_redirects=True)
-            print(f"✅ {endpoint} - Status: {response.status_code}")
+            response = session.head(endpoint, timeout=(2, 5), allow_redirects=True)
+            return f"✅ {endpoint} - Status: {response.status_code}"
         except requests.exceptions.ConnectionError:
-            print(f"❌ {endpoint} - Connection failed")
+            return f"❌ {endpoint} - Connection failed"
         except requests.exceptions.Timeout:
-            print(f"⏱️  {endpoint} - Timeout")
+            return f"⏱️  {endpoint} - Timeout"
         except Exception as e:
-            print(f"❓ {endpoint} - Error: {type(e).__name__}")
+            return f"❓ {endpoint} - Error: {type(e).__name__}"
+
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+        for line in pool.map(probe, endpoints):
+            print(line)
 
 if __name__ == "__main__":
     # First test endpoint connectivity
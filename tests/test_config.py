@@ -1,13 +1,22 @@
 """Unit tests for configuration module."""
 import pytest
-import tempfile
-import json
 from pathlib import Path
-from unittest.mock import patch, Mock
 
 from syft_installer._config import Config
 
 
+@pytest.fixture
+def syft_home(tmp_path, monkeypatch):
+    """Point the home directory at a per-test tmp dir.
+
+    Setting HOME lets Path.home() resolve natively instead of going
+    through a mock on every config_dir/config_file access.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))  # Windows
+    return tmp_path
+
+
 class TestConfig:
     """Test Config class."""
     
@@ -26,102 +35,70 @@ class TestConfig:
         assert config.refresh_token == "test_token"
         assert config.client_url == "http://localhost:7938"
     
-    def test_config_dir(self):
+    def test_config_dir(self, base_config):
         """Test config directory path."""
-        config = Config(
-            email="test@example.com",
-            server_url="https://syftbox.net",
-            data_dir="/path/to/data"
-        )
-        
         expected = Path.home() / ".syftbox"
-        assert config.config_dir == expected
+        assert base_config.config_dir == expected
     
-    def test_config_file(self):
+    def test_config_file(self, base_config):
         """Test config file path."""
-        config = Config(
-            email="test@example.com",
-            server_url="https://syftbox.net",
-            data_dir="/path/to/data"
-        )
-        
         expected = Path.home() / ".syftbox" / "config.json"
-        assert config.config_file == expected
+        assert base_config.config_file == expected
     
-    def test_binary_path(self):
+    def test_binary_path(self, base_config):
         """Test binary path."""
+        expected = Path.home() / ".local" / "bin" / "syftbox"
+        assert base_config.binary_path == expected
+    
+    def test_save_and_load(self, syft_home):
+        """Test saving and loading configuration."""
         config = Config(
             email="test@example.com",
             server_url="https://syftbox.net",
-            data_dir="/path/to/data"
+            data_dir="/path/to/data",
+            refresh_token="test_refresh_token"
         )
         
-        expected = Path.home() / ".local" / "bin" / "syftbox"
-        assert config.binary_path == expected
-    
-    def test_save_and_load(self):
-        """Test saving and loading configuration."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Mock home directory
-            with patch('pathlib.Path.home', return_value=Path(tmp_dir)):
-                config = Config(
-                    email="test@example.com",
-                    server_url="https://syftbox.net",
-                    data_dir="/path/to/data",
-                    refresh_token="test_refresh_token"
-                )
-                
-                # Save config
-                config.save()
-                
-                # Verify file exists
-                config_file = Path(tmp_dir) / ".syftbox" / "config.json"
-                assert config_file.exists()
-                
-                # Load config
-                loaded_config = Config.load()
-                assert loaded_config is not None
-                assert loaded_config.email == "test@example.com"
-                assert loaded_config.server_url == "https://syftbox.net"
-                assert loaded_config.data_dir == "/path/to/data"
-                assert loaded_config.refresh_token == "test_refresh_token"
-                # access_token is not saved/loaded, only refresh_token
+        # Save config
+        config.save()
+        
+        # Verify file exists
+        config_file = syft_home / ".syftbox" / "config.json"
+        assert config_file.exists()
+        
+        # Load config
+        loaded_config = Config.load()
+        assert loaded_config is not None
+        assert loaded_config.email == "test@example.com"
+        assert loaded_config.server_url == "https://syftbox.net"
+        assert loaded_config.data_dir == "/path/to/data"
+        assert loaded_config.refresh_token == "test_refresh_token"
+        # access_token is not saved/loaded, only refresh_token
     
-    def test_load_nonexistent(self):
+    def test_load_nonexistent(self, syft_home):
         """Test loading when config doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            with patch('pathlib.Path.home', return_value=Path(tmp_dir)):
-                config = Config.load()
-                assert config is None
+        config = Config.load()
+        assert config is None
     
-    def test_load_invalid_json(self):
+    def test_load_invalid_json(self, syft_home):
         """Test loading invalid JSON."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            with patch('pathlib.Path.home', return_value=Path(tmp_dir)):
-                config_dir = Path(tmp_dir) / ".syftbox"
-                config_dir.mkdir(parents=True)
-                config_file = config_dir / "config.json"
-                
-                # Write invalid JSON
-                config_file.write_text("invalid json")
-                
-                config = Config.load()
-                assert config is None
+        config_dir = syft_home / ".syftbox"
+        config_dir.mkdir(parents=True)
+        config_file = config_dir / "config.json"
+        
+        # Write invalid JSON
+        config_file.write_text("invalid json")
+        
+        config = Config.load()
+        assert config is None
     
-    def test_to_dict(self):
+    def test_to_dict(self, base_config):
         """Test converting config to dictionary."""
-        config = Config(
-            email="test@example.com",
-            server_url="https://syftbox.net",
-            data_dir="/path/to/data",
-            refresh_token="test_refresh_token"
-        )
-        
-        data = config.to_dict()
+        data = base_config.to_dict()
         assert data["email"] == "test@example.com"
         assert data["server_url"] == "https://syftbox.net"
         assert data["data_dir"] == "/path/to/data"
-        assert data["refresh_token"] == "test_refresh_token"
+        assert data["refresh_token"] == "test_token"
         assert "refresh_token" in data
     
     # Removed test_to_dict_with_access_token as Config doesn't have access_token field
@@ -156,22 +133,13 @@ class TestConfig:
         # data_dir should get default value
         assert config.data_dir is not None
     
-    def test_save_creates_directory(self):
+    def test_save_creates_directory(self, syft_home, base_config):
         """Test that save creates the config directory if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            with patch('pathlib.Path.home', return_value=Path(tmp_dir)):
-                config = Config(
-                    email="test@example.com",
-                    server_url="https://syftbox.net",
-                    data_dir="/path/to/data",
-                    refresh_token="test_token"
-                )
-                
-                # Directory shouldn't exist yet
-                config_dir = Path(tmp_dir) / ".syftbox"
-                assert not config_dir.exists()
-                
-                # Save should create it
-                config.save()
-                assert config_dir.exists()
-                assert config_dir.is_dir()
\ No newline at end of file
+        # Directory shouldn't exist yet
+        config_dir = syft_home / ".syftbox"
+        assert not config_dir.exists()
+        
+        # Save should create it
+        base_config.save()
+        assert config_dir.exists()
+        assert config_dir.is_dir()
\ No newline at end of file
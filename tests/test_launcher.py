@@ -1,109 +1,95 @@
 """Unit tests for process management module."""
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
-import subprocess
-from pathlib import Path
+from unittest.mock import patch
 
 from syft_installer._process import ProcessManager
 from syft_installer._config import Config
 from syft_installer._utils import BinaryNotFoundError
 
 
+@pytest.fixture
+def test_config(tmp_path, monkeypatch):
+    """A Config rooted in a per-test home with a real executable binary.
+
+    A real file beats patching os.access/Path.exists globally: the stat
+    is cheap and the mock can't leak into unrelated path operations.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config = Config(
+        email="test@example.com",
+        server_url="https://syftbox.net",
+        data_dir="/test/data"
+    )
+    config.binary_path.parent.mkdir(parents=True)
+    config.binary_path.touch(mode=0o755)
+    return config
+
+
 class TestProcessManager:
     """Test ProcessManager class."""
-    
+
     def test_init(self):
         """Test process manager initialization."""
         pm = ProcessManager()
         assert pm.process is None
     
     @patch('syft_installer._process.ProcessManager._run_foreground')
-    def test_start_foreground(self, mock_run_fg):
+    def test_start_foreground(self, mock_run_fg, test_config):
         """Test starting client in foreground."""
-        config = Config(
-            email="test@example.com",
-            server_url="https://syftbox.net",
-            data_dir="/test/data"
-        )
-        
-        with patch.object(Path, 'exists', return_value=True):
-            with patch.object(ProcessManager, 'is_running', return_value=False):
-                pm = ProcessManager()
-                pm.start(config, background=False)
-                
-                mock_run_fg.assert_called_once()
+        with patch.object(ProcessManager, 'is_running', return_value=False):
+            pm = ProcessManager()
+            pm.start(test_config, background=False)
+
+            mock_run_fg.assert_called_once()
     
     @patch('syft_installer._process.ProcessManager._run_background')
-    def test_start_background(self, mock_run_bg):
+    def test_start_background(self, mock_run_bg, test_config):
         """Test starting client in background."""
-        config = Config(
-            email="test@example.com",
-            server_url="https://syftbox.net",
-            data_dir="/test/data"
-        )
-        
-        with patch.object(Path, 'exists', return_value=True):
-            with patch.object(ProcessManager, 'is_running', return_value=False):
-                pm = ProcessManager()
-                pm.start(config, background=True)
-                
-                mock_run_bg.assert_called_once()
+        with patch.object(ProcessManager, 'is_running', return_value=False):
+            pm = ProcessManager()
+            pm.start(test_config, background=True)
+
+            mock_run_bg.assert_called_once()
     
-    def test_start_binary_not_found(self):
+    def test_start_binary_not_found(self, test_config):
         """Test starting when binary doesn't exist."""
-        config = Config(
-            email="test@example.com",
-            server_url="https://syftbox.net",
-            data_dir="/test/data"
-        )
-        
-        with patch.object(Path, 'exists', return_value=False):
+        test_config.binary_path.unlink()
+
+        with patch.object(ProcessManager, 'is_running', return_value=False):
             pm = ProcessManager()
             with pytest.raises(BinaryNotFoundError):
-                pm.start(config)
+                pm.start(test_config)
     
-    def test_start_already_running(self):
+    def test_start_already_running(self, test_config, running_process):
         """Test starting when already running."""
-        config = Config(
-            email="test@example.com",
-            server_url="https://syftbox.net",
-            data_dir="/test/data"
-        )
-        
         pm = ProcessManager()
-        pm.process = Mock()
-        pm.process.poll.return_value = None  # Still running
-        
-        with patch.object(Path, 'exists', return_value=True):
-            with patch('syft_installer._process.ProcessManager._run_background') as mock_run:
-                pm.start(config)
-                mock_run.assert_not_called()  # Should not start again
+        pm.process = running_process
+
+        with patch('syft_installer._process.ProcessManager._run_background') as mock_run:
+            pm.start(test_config)
+            mock_run.assert_not_called()  # Should not start again
     
-    def test_stop(self):
+    def test_stop(self, running_process, tmp_path, monkeypatch):
         """Test stopping the client."""
-        mock_process = Mock()
-        mock_process.poll.return_value = None  # Still running
-        
+        # stop() clears the pid file on success - keep it under tmp_path
+        monkeypatch.setenv("HOME", str(tmp_path))
         pm = ProcessManager()
-        pm.process = mock_process
-        
+        pm.process = running_process
+
         pm.stop()
-        
-        mock_process.terminate.assert_called_once()
+
+        running_process.terminate.assert_called_once()
     
-    def test_stop_timeout(self):
+    def test_stop_timeout(self, timeout_process, tmp_path, monkeypatch):
         """Test stopping with timeout."""
-        mock_process = Mock()
-        mock_process.poll.return_value = None
-        mock_process.wait.side_effect = subprocess.TimeoutExpired("cmd", 5)
-        
+        monkeypatch.setenv("HOME", str(tmp_path))
         pm = ProcessManager()
-        pm.process = mock_process
-        
+        pm.process = timeout_process
+
         pm.stop()
-        
-        mock_process.terminate.assert_called_once()
-        mock_process.kill.assert_called_once()
+
+        timeout_process.terminate.assert_called_once()
+        timeout_process.kill.assert_called_once()
     
     def test_stop_not_running(self):
         """Test stopping when not running."""
@@ -116,57 +102,47 @@ class TestProcessManager:
         # at a higher level by calling stop() then start()
         pass
     
-    def test_is_running_with_process(self):
+    def test_is_running_with_process(self, running_process):
         """Test checking if running with active process."""
-        mock_process = Mock()
-        mock_process.poll.return_value = None  # Still running
-        
         pm = ProcessManager()
-        pm.process = mock_process
-        
-        # ProcessManager.is_running() uses pgrep, not process state
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "12345\n"
+        pm.process = running_process
+
+        # ProcessManager.is_running() scans the process table, not process
+        # state; pin the platform so the /proc branch runs off-Linux too
+        with patch('syft_installer._process.sys.platform', 'linux'), \
+             patch.object(ProcessManager, '_check_pid_file', return_value=False), \
+             patch.object(ProcessManager, '_find_syftbox_pids', return_value=[12345]):
             assert pm.is_running() is True
-    
-    def test_is_running_process_exited(self):
+
+    def test_is_running_process_exited(self, exited_process):
         """Test checking if running with exited process."""
-        mock_process = Mock()
-        mock_process.poll.return_value = 0  # Exited
-        
         pm = ProcessManager()
-        pm.process = mock_process
-        
-        # Mock pgrep to return no results
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 1
+        pm.process = exited_process
+
+        # No daemons found in the process table
+        with patch('syft_installer._process.sys.platform', 'linux'), \
+             patch.object(ProcessManager, '_check_pid_file', return_value=False), \
+             patch.object(ProcessManager, '_find_syftbox_pids', return_value=[]):
             assert pm.is_running() is False
-    
-    @patch('subprocess.run')
-    def test_is_running_external_process(self, mock_run):
+
+    def test_is_running_external_process(self):
         """Test checking for external syftbox process."""
-        # Mock pgrep finding a process
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = "12345\n"
-        
         pm = ProcessManager()
-        assert pm.is_running() is True
-        
-        mock_run.assert_called_once_with(
-            ["pgrep", "-f", "syftbox daemon"],
-            capture_output=True,
-            text=True
-        )
-    
-    @patch('subprocess.run')
-    def test_is_running_no_external_process(self, mock_run):
+
+        with patch('syft_installer._process.sys.platform', 'linux'), \
+             patch.object(ProcessManager, '_check_pid_file', return_value=False), \
+             patch.object(ProcessManager, '_find_syftbox_pids', return_value=[12345]) as mock_scan:
+            assert pm.is_running() is True
+            mock_scan.assert_called_once()
+
+    def test_is_running_no_external_process(self):
         """Test checking when no external process exists."""
-        mock_run.return_value.returncode = 1
-        mock_run.return_value.stdout = ""
-        
         pm = ProcessManager()
-        assert pm.is_running() is False
+
+        with patch('syft_installer._process.sys.platform', 'linux'), \
+             patch.object(ProcessManager, '_check_pid_file', return_value=False), \
+             patch.object(ProcessManager, '_find_syftbox_pids', return_value=[]):
+            assert pm.is_running() is False
     
     def test_find_daemons(self):
         """Test finding daemon processes."""
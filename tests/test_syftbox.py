@@ -0,0 +1,41 @@
+"""Unit tests for module-level helpers in _syftbox."""
+import os
+
+from syft_installer._syftbox import _fast_rmtree
+
+
+class TestFastRmtree:
+    """Test the scandir-based tree deletion."""
+
+    def test_deletes_tree(self, tmp_path):
+        """Test that a nested tree is fully removed."""
+        root = tmp_path / "data"
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "a" / "file.txt").write_text("x")
+        (root / "top.txt").write_text("y")
+
+        _fast_rmtree(root)
+
+        assert not root.exists()
+
+    def test_unscannable_subtree_terminates(self, tmp_path, monkeypatch):
+        """Test that an undeletable subtree doesn't hang the walk."""
+        root = tmp_path / "data"
+        blocked = root / "blocked"
+        (blocked / "inner").mkdir(parents=True)
+        (root / "file.txt").write_text("x")
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(blocked):
+                raise PermissionError(13, "Permission denied", str(blocked))
+            return real_scandir(path)
+
+        monkeypatch.setattr("syft_installer._syftbox.os.scandir", scandir)
+
+        # Must terminate; best-effort semantics leave the blocked dir
+        _fast_rmtree(root)
+
+        assert not (root / "file.txt").exists()
+        assert blocked.exists()